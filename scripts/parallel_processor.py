@@ -8,23 +8,31 @@ import os
 import sys
 import time
 import json
+import math
+import heapq
 import logging
 import asyncio
+import atexit
+import ssl
+import queue
+import threading
 import aiohttp
-import aiofiles
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg2.pool
+from psycopg2.extras import RealDictCursor, execute_values
+from contextlib import contextmanager
 from datetime import datetime
 import subprocess
 from tqdm.asyncio import tqdm as async_tqdm
 from tqdm import tqdm
 import random
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
 
 # Import necessary modules for transcription
 import numpy as np
+import ctranslate2
 from faster_whisper import WhisperModel
 
 # Configure logging
@@ -34,63 +42,104 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Module-level function for multiprocessing
-def transcribe_chunk_worker(args):
-    """Worker function for transcribing chunks (must be at module level for multiprocessing)"""
-    chunk_info, whisper_model, transcription_mode = args
-    
-    # Initialize model for this process
-    model = WhisperModel(
-        whisper_model, 
-        device="cpu",
-        compute_type="int8",
-        cpu_threads=2
-    )
+# Extracted audio format: 16 kHz mono PCM s16le, read from ffmpeg 10 s at a time
+SAMPLE_RATE = 16000
+PCM_READ_BYTES = SAMPLE_RATE * 2 * 10
+
+# A chunk may run this many seconds past its target length to end on a silence
+SPLIT_LOOKAHEAD = 5
+
+# Silence detection: 25 ms windows with RMS below -40 dBFS are silent, and at least
+# 0.5 s of consecutive silent windows make a silence period (as ffmpeg silencedetect)
+SILENCE_WINDOW = 0.025
+SILENCE_MIN_DURATION = 0.5
+SILENCE_THRESHOLD = 32768 * 10 ** (-40 / 20)
+
+# HTTP downloads are read and written in 1 MiB blocks
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Buffered status updates are flushed every interval or once this many are queued
+STATUS_FLUSH_INTERVAL = 1.0
+STATUS_FLUSH_SIZE = 50
+
+# Completed transcriptions are written in batches of up to this many (or every interval)
+COMPLETION_FLUSH_SIZE = 16
+
+# Status values that also stamp a "started at" column: field -> (value, column)
+STATUS_STARTED_COLUMNS = {
+    'download_status': ('downloading', 'download_started_at'),
+    'transcription_status': ('processing', 'transcription_started_at'),
+}
+
+# Characters that cannot appear in output file names
+_SANITIZE = str.maketrans({'/': '_', '\\': '_'})
+
+# Header written at the top of every .txt transcript
+TRANSCRIPT_HEADER = (
+    "# {title}\n"
+    "# State: MI\n"
+    "# Chamber: {chamber}\n"
+    "# Hearing ID: {hearing_id}\n"
+    "# Transcribed: {transcribed}\n"
+    "# Duration: {duration:.1f} seconds\n"
+    "# Method: Chunked Parallel Processing\n"
+    "# Chunks: {chunks}\n\n"
+)
+
+def detect_device():
+    """Pick the inference device: WHISPER_DEVICE override, else cuda when a GPU is visible"""
+    device = os.environ.get('WHISPER_DEVICE', 'auto')
+    if device != 'auto':
+        return device
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+def detect_compute_type(device="cpu"):
+    """Pick the compute type: COMPUTE_TYPE override, float16 on GPU, else mixed int8 when the CPU supports it"""
+    override = os.environ.get('COMPUTE_TYPE')
+    if override:
+        return override
     
-    # Select transcription parameters based on mode
-    if transcription_mode == 'fast':
-        beam_size = 3
-        best_of = 3
-        condition_on_previous_text = False
-    else:  # quality mode
-        beam_size = 5
-        best_of = 5
-        condition_on_previous_text = True
-    
-    # Transcribe
-    segments, info = model.transcribe(
-        str(chunk_info['path']),
-        language="en",
-        beam_size=beam_size,
-        best_of=best_of,
-        condition_on_previous_text=condition_on_previous_text,
-        vad_filter=True,
-        vad_parameters=dict(min_silence_duration_ms=500)
-    )
+    if device == "cuda":
+        return "float16"
     
-    # Convert generator to list and adjust timestamps
-    segment_list = []
-    text_parts = []
+    try:
+        with open('/proc/cpuinfo') as f:
+            flags = set(f.read().split())
+    except OSError:
+        return "int8"
     
-    for segment in segments:
-        # Adjust timestamps to account for chunk offset
-        adjusted_segment = {
-            'start': segment.start + chunk_info['start'],
-            'end': segment.end + chunk_info['start'],
-            'text': segment.text.strip()
-        }
-        if adjusted_segment['text']:
-            segment_list.append(adjusted_segment)
-            text_parts.append(adjusted_segment['text'])
-    
-    # Clean up chunk file
-    Path(chunk_info['path']).unlink()
-    
-    return {
-        'text': '\n'.join(text_parts),
-        'segments': segment_list,
-        'chunk_index': chunk_info['index']
-    }
+    # int8 weights keep the encoder bandwidth low; 16-bit activations speed up the decoder
+    supported = ctranslate2.get_supported_compute_types("cpu")
+    if 'avx512_bf16' in flags and 'int8_bfloat16' in supported:
+        return "int8_bfloat16"
+    if 'f16c' in flags and 'int8_float16' in supported:
+        return "int8_float16"
+    return "int8"
+
+def _write_fully(file, data):
+    """Write all of data to an unbuffered file, retrying on short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[file.write(view):]
+
+def _write_outputs(text_path, text, json_path, header_text, segments_path, segment_lines):
+    """Write the transcript text, its JSON header and the pre-serialized segments as NDJSON (one per line)
+    
+    Each file is written to a .tmp sibling and renamed into place, so a crash never leaves a
+    truncated output behind. The header goes last: once it exists, the files it references do too.
+    """
+    segments_tmp = segments_path.with_name(segments_path.name + '.tmp')
+    with open(segments_tmp, 'w') as f:
+        f.writelines(line + '\n' for line in segment_lines)
+    os.replace(segments_tmp, segments_path)
+    
+    text_tmp = text_path.with_name(text_path.name + '.tmp')
+    text_tmp.write_text(text)
+    os.replace(text_tmp, text_path)
+    
+    json_tmp = json_path.with_name(json_path.name + '.tmp')
+    json_tmp.write_text(header_text)
+    os.replace(json_tmp, json_path)
 
 class ParallelProcessor:
     def __init__(self, db_url, max_downloads=3, max_transcriptions=2, chunk_duration=30):
@@ -99,6 +148,9 @@ class ParallelProcessor:
         self.max_transcriptions = max_transcriptions
         self.chunk_duration = chunk_duration  # For audio chunking
         
+        # Pooled database connections shared by the download and transcription workers
+        self.db_pool = psycopg2.pool.ThreadedConnectionPool(1, max_downloads + max_transcriptions + 2, db_url)
+        
         # Paths
         self.project_root = Path(__file__).parent.parent
         self.videos_dir = self.project_root / "tmp" / "videos"
@@ -113,31 +165,81 @@ class ParallelProcessor:
         self.download_queue = asyncio.Queue()
         self.transcription_queue = asyncio.Queue()
         
+        # Shared HTTP session, opened by process_hearings for the duration of a run
+        self.http_session = None
+        
+        # SSL context that ignores certificate errors, built once for every session
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+        
+        # Status updates waiting to be written in one batch
+        self._status_buf = []
+        self._status_lock = asyncio.Lock()
+        
+        # Completed transcriptions waiting to be written in one batch (filled from worker threads)
+        self._completion_buf = []
+        self._completion_lock = threading.Lock()
+        
         # Progress tracking
         self.download_progress = {}
         self.transcription_progress = {}
         
         # Performance metrics
-        self.performance_stats = {
-            'downloads': {'successful': 0, 'failed': 0, 'total_bytes': 0, 'total_time': 0},
-            'transcriptions': {'successful': 0, 'failed': 0, 'total_audio_duration': 0, 'total_time': 0}
-        }
+        self.reset_performance_stats()
         
         # Transcription settings
         self.transcriptions_dir = self.project_root / "transcriptions"
         self.transcriptions_dir.mkdir(parents=True, exist_ok=True)
         self.whisper_model = os.environ.get('WHISPER_MODEL', 'small')
+        # Hearings are English-only; the .en variants are smaller and skip language detection
+        if self.whisper_model in ('tiny', 'base', 'small', 'medium'):
+            self.whisper_model += '.en'
+        # Optional pre-converted int8 CTranslate2 model directory (skips load-time quantization)
+        self.whisper_model_path = os.environ.get('WHISPER_MODEL_PATH') or self.whisper_model
+        self.device = detect_device()
+        self.compute_type = detect_compute_type(self.device)
         self.delete_after = os.environ.get('DELETE_AFTER_TRANSCRIPTION', 'true').lower() == 'true'
-        self.transcription_mode = os.environ.get('TRANSCRIPTION_MODE', 'quality')  # 'quality' or 'fast'
-        
-        # Initialize Whisper model
-        logger.info(f"Loading Whisper model: {self.whisper_model}")
-        self.model = WhisperModel(self.whisper_model, device="cpu", compute_type="int8")
+        self.transcription_mode = os.environ.get('TRANSCRIPTION_MODE', 'fast')  # 'quality' or 'fast'
         
-        # CPU info for chunking
-        self.total_cores = cpu_count()
+        # CPU info for chunking: only count the cores this process may run on (taskset,
+        # container CPU sets), so chunk workers x model threads never oversubscribe them
+        if hasattr(os, 'sched_getaffinity'):
+            self.total_cores = len(os.sched_getaffinity(0))
+        else:
+            self.total_cores = cpu_count()
         logger.info(f"System has {self.total_cores} CPU cores available")
         
+        # Chunks from every hearing are transcribed on one shared thread pool. On GPU a single
+        # worker keeps one CUDA context and one copy of the weights busy; parallel workers would
+        # only contend for the same device.
+        if self.device == "cuda":
+            self.chunk_workers = 1
+        else:
+            self.chunk_workers = max(1, self.total_cores // 2)  # Use half the cores
+        self.chunk_executor = ThreadPoolExecutor(max_workers=self.chunk_workers)
+        
+        # Finished videos are deleted by a background reaper so slow unlinks (large files,
+        # network volumes) never hold up the next transcription
+        self._reaper_queue = queue.Queue()
+        self._reaper = threading.Thread(target=self._reap_files, name='file-reaper', daemon=True)
+        self._reaper.start()
+        
+        # Initialize Whisper model, shared by all chunk threads. CTranslate2 releases the GIL,
+        # and num_workers lets that many transcribe() calls run truly in parallel.
+        logger.info(f"Loading Whisper model: {self.whisper_model_path} ({self.device}, {self.compute_type})")
+        self.model = WhisperModel(
+            self.whisper_model_path,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=max(1, self.total_cores // self.chunk_workers),
+            num_workers=self.chunk_workers
+        )
+        
+        # The chunk pool and model live for the whole process; make sure they are released
+        # even if the caller never reaches close()
+        atexit.register(self.close)
+        
     async def download_video(self, hearing, retry_count=0):
         """Download a video with progress tracking and retry logic"""
         video_id = hearing['id']
@@ -153,7 +255,7 @@ class ParallelProcessor:
         logger.info(f"Starting download: {hearing['title']} (attempt {retry_count + 1}/{max_retries + 1})")
         
         # Track download start time
-        self.download_progress[video_id] = {'start_time': time.time()}
+        self.download_progress[video_id] = {'start_time': time.monotonic()}
         
         # Update status
         await self.update_status(video_id, 'download_status', 'downloading')
@@ -199,47 +301,51 @@ class ParallelProcessor:
                 
             else:
                 # Use regular HTTP download for direct MP4 files
-                # Create SSL context that ignores certificate errors
-                import ssl
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                # Download with progress
-                async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
-                    async with session.get(video_url) as response:
-                        total_size = int(response.headers.get('Content-Length', 0))
-                        
-                        # Initialize progress bar
-                        progress_bar = async_tqdm(
-                            total=total_size,
-                            unit='B',
-                            unit_scale=True,
-                            desc=f"Downloading {hearing['title'][:30]}..."
-                        )
-                        
-                        downloaded = 0
-                        async with aiofiles.open(video_path, 'wb') as file:
-                            async for chunk in response.content.iter_chunked(8192):
-                                await file.write(chunk)
-                                downloaded += len(chunk)
-                                progress_bar.update(len(chunk))
-                                
-                                # Update progress tracking
-                                self.download_progress[video_id] = {
-                                    'total': total_size,
-                                    'downloaded': downloaded,
-                                    'percent': (downloaded / total_size * 100) if total_size > 0 else 0
-                                }
+                # Download with progress over the shared session
+                async with self.http_session.get(video_url) as response:
+                    total_size = int(response.headers.get('Content-Length', 0))
+                    
+                    # Initialize progress bar
+                    progress_bar = async_tqdm(
+                        total=total_size,
+                        unit='B',
+                        unit_scale=True,
+                        desc=f"Downloading {hearing['title'][:30]}..."
+                    )
+                    
+                    downloaded = 0
+                    loop = asyncio.get_event_loop()
+                    # Unbuffered file: each block is a single write() on an executor thread.
+                    # The stream hands back whatever is buffered, so reads are collected until a
+                    # full block is ready.
+                    with open(video_path, 'wb', buffering=0) as file:
+                        block = bytearray()
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            block += chunk
+                            if len(block) >= DOWNLOAD_CHUNK_SIZE:
+                                await loop.run_in_executor(None, _write_fully, file, block)
+                                block = bytearray()
+                            downloaded += len(chunk)
+                            progress_bar.update(len(chunk))
+                            
+                            # Update progress tracking
+                            self.download_progress[video_id] = {
+                                'total': total_size,
+                                'downloaded': downloaded,
+                                'percent': (downloaded / total_size * 100) if total_size > 0 else 0
+                            }
                         
-                        progress_bar.close()
+                        if block:
+                            await loop.run_in_executor(None, _write_fully, file, block)
+                    
+                    progress_bar.close()
             
             # Update database
             file_size = video_path.stat().st_size
             await self.update_download_complete(video_id, str(video_path.name), file_size)
             
             # Update performance stats
-            download_time = time.time() - (self.download_progress.get(video_id, {}).get('start_time', time.time()))
+            download_time = time.monotonic() - (self.download_progress.get(video_id, {}).get('start_time', time.monotonic()))
             self.performance_stats['downloads']['successful'] += 1
             self.performance_stats['downloads']['total_bytes'] += file_size
             self.performance_stats['downloads']['total_time'] += download_time
@@ -261,14 +367,85 @@ class ParallelProcessor:
                 await self.update_status(video_id, 'download_status', 'failed', str(e))
                 return None
     
+    @contextmanager
+    def _db_connection(self):
+        """Borrow a pooled connection; commits on success and rolls back on error"""
+        conn = self.db_pool.getconn()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.db_pool.putconn(conn)
+    
     async def update_status(self, hearing_id, status_field, status_value, error_msg=None):
-        """Update status in database"""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._update_status_sync, hearing_id, status_field, status_value, error_msg)
+        """Queue a status update; it is written with the next batch flush"""
+        async with self._status_lock:
+            self._status_buf.append((hearing_id, status_field, status_value))
+            should_flush = len(self._status_buf) >= STATUS_FLUSH_SIZE
+        
+        if should_flush:
+            await self.flush_status_updates()
+    
+    async def flush_status_updates(self):
+        """Write all buffered status updates to the database"""
+        # Holding the lock across the write keeps batches in submission order
+        async with self._status_lock:
+            pending, self._status_buf = self._status_buf, []
+            if pending:
+                loop = asyncio.get_event_loop()
+                try:
+                    await loop.run_in_executor(None, self._flush_status_sync, pending)
+                except Exception:
+                    # Keep the updates (ahead of any newer ones) for the next flush
+                    self._status_buf[:0] = pending
+                    raise
+    
+    async def status_flusher(self, stop):
+        """Flush buffered status updates periodically until stop is set"""
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=STATUS_FLUSH_INTERVAL)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush_status_updates()
+            except Exception as e:
+                logger.error(f"Status flush error: {str(e)}")
+    
+    def _flush_status_sync(self, pending):
+        """Synchronous batched status update, one UPDATE per status field"""
+        # Only the latest value per hearing and field is written, but the "started at" column
+        # is stamped if any update in the batch had the start value (e.g. 'downloading' then 'failed')
+        latest = {}
+        started = set()
+        for hearing_id, status_field, status_value in pending:
+            latest[(hearing_id, status_field)] = status_value
+            if STATUS_STARTED_COLUMNS.get(status_field, (None,))[0] == status_value:
+                started.add((hearing_id, status_field))
+        
+        rows_by_field = {}
+        for key, status_value in latest.items():
+            hearing_id, status_field = key
+            rows_by_field.setdefault(status_field, []).append((str(hearing_id), status_value, key in started))
+        
+        with self._db_connection() as conn:
+            with conn.cursor() as cur:
+                for status_field, rows in rows_by_field.items():
+                    started_column = ""
+                    if status_field in STATUS_STARTED_COLUMNS:
+                        column = STATUS_STARTED_COLUMNS[status_field][1]
+                        started_column = f", {column} = CASE WHEN v.started THEN NOW() ELSE h.{column} END"
+                    execute_values(
+                        cur,
+                        f"UPDATE hearings AS h SET {status_field} = v.value{started_column} "
+                        f"FROM (VALUES %s) AS v(id, value, started) WHERE h.id = v.id::uuid",
+                        rows
+                    )
     
     def _update_status_sync(self, hearing_id, status_field, status_value, error_msg=None):
         """Synchronous database update"""
-        with psycopg2.connect(self.db_url) as conn:
+        with self._db_connection() as conn:
             with conn.cursor() as cur:
                 # Add timestamp fields based on status changes
                 if status_field == 'download_status' and status_value == 'downloading':
@@ -290,12 +467,14 @@ class ParallelProcessor:
     
     async def update_download_complete(self, hearing_id, filename, file_size):
         """Update download completion in database"""
+        # Earlier buffered updates for this hearing must not land after the completion
+        await self.flush_status_updates()
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, self._update_download_complete_sync, hearing_id, filename, file_size)
     
     def _update_download_complete_sync(self, hearing_id, filename, file_size):
         """Synchronous download completion update"""
-        with psycopg2.connect(self.db_url) as conn:
+        with self._db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     UPDATE hearings 
@@ -307,112 +486,172 @@ class ParallelProcessor:
                 """, (filename, file_size, hearing_id))
                 conn.commit()
     
-    def get_audio_duration(self, audio_path):
-        """Get duration of audio file in seconds"""
-        cmd = [
-            'ffprobe', '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            str(audio_path)
+    def detect_silence(self, samples):
+        """Find silent stretches in PCM samples, returned as {'start', 'end'} in seconds"""
+        window = int(SILENCE_WINDOW * SAMPLE_RATE)
+        num_windows = len(samples) // window
+        if num_windows == 0:
+            return []
+        
+        # RMS level per window, compared in the squared domain to skip the sqrt
+        windows = samples[:num_windows * window].reshape(num_windows, window).astype(np.float32)
+        silent = np.einsum('ij,ij->i', windows, windows) / window < SILENCE_THRESHOLD ** 2
+        
+        # Runs of consecutive silent windows that are long enough become silence periods
+        edges = np.diff(silent.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        long_enough = (ends - starts) * SILENCE_WINDOW >= SILENCE_MIN_DURATION
+        return [
+            {'start': start * SILENCE_WINDOW, 'end': end * SILENCE_WINDOW}
+            for start, end in zip(starts[long_enough].tolist(), ends[long_enough].tolist())
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return float(result.stdout.strip())
     
-    def extract_audio(self, video_path, audio_path):
-        """Extract audio from video using ffmpeg"""
+    def stream_audio_chunks(self, video_path, audio_info):
+        """Decode audio with ffmpeg and yield silence-aligned chunks as soon as they are available
+        
+        Chunks carry their int16 samples, so no audio is written to disk. The total duration is
+        stored in audio_info['duration'] once the stream is exhausted.
+        """
         cmd = [
             'ffmpeg', '-i', str(video_path),
-            '-vn', '-acodec', 'pcm_s16le',
-            '-ar', '16000', '-ac', '1',
-            str(audio_path), '-y', '-loglevel', 'error'
+            '-vn', '-f', 's16le', '-acodec', 'pcm_s16le',
+            '-ar', str(SAMPLE_RATE), '-ac', '1',
+            'pipe:1', '-loglevel', 'error'
         ]
-        subprocess.run(cmd, check=True)
-        return audio_path
-    
-    def split_audio_with_silence_detection(self, audio_path, hearing_id):
-        """Split audio into chunks at silence boundaries"""
-        duration = self.get_audio_duration(audio_path)
-        chunks = []
-        
-        # First, detect silence periods
-        silence_cmd = [
-            'ffmpeg', '-i', str(audio_path),
-            '-af', 'silencedetect=noise=-40dB:d=0.5',
-            '-f', 'null', '-'
-        ]
-        result = subprocess.run(silence_cmd, capture_output=True, text=True)
-        
-        # Parse silence periods from stderr
-        silence_periods = []
-        for line in result.stderr.split('\n'):
-            if 'silence_start:' in line:
-                start = float(line.split('silence_start: ')[1].split()[0])
-                silence_periods.append({'start': start})
-            elif 'silence_end:' in line and silence_periods and 'end' not in silence_periods[-1]:
-                end = float(line.split('silence_end: ')[1].split()[0])
-                silence_periods[-1]['end'] = end
-        
-        # Create chunks based on silence periods
-        current_start = 0
-        chunk_num = 0
-        
-        while current_start < duration:
-            # Target end time
-            target_end = min(current_start + self.chunk_duration, duration)
-            
-            # Find nearest silence period to target_end
-            best_split = target_end
-            min_distance = float('inf')
-            
-            for silence in silence_periods:
-                if 'end' in silence and current_start < silence['end'] <= target_end + 5:
-                    distance = abs(silence['end'] - target_end)
-                    if distance < min_distance:
-                        min_distance = distance
-                        best_split = silence['end']
-            
-            # Create chunk
-            chunk_path = self.temp_dir / f"{hearing_id}_chunk_{chunk_num:03d}.wav"
-            chunk_duration = best_split - current_start
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+        
+        try:
+            buffer = np.empty(0, dtype=np.int16)
+            buffer_start = 0  # Absolute sample index of buffer[0]
+            needed = (self.chunk_duration + SPLIT_LOOKAHEAD) * SAMPLE_RATE
+            eof = False
+            chunk_num = 0
             
-            if chunk_duration > 0.5:  # Skip very short chunks
-                cmd = [
-                    'ffmpeg', '-i', str(audio_path),
-                    '-ss', str(current_start),
-                    '-t', str(chunk_duration),
-                    '-c', 'copy', str(chunk_path),
-                    '-y', '-loglevel', 'error'
-                ]
-                subprocess.run(cmd, check=True)
+            while True:
+                # Buffer enough audio to search past the target end for a silence
+                while not eof and len(buffer) < needed:
+                    data = process.stdout.read(PCM_READ_BYTES)
+                    if not data:
+                        eof = True
+                        break
+                    buffer = np.concatenate((buffer, np.frombuffer(data, dtype=np.int16)))
+                
+                if len(buffer) == 0:
+                    break
+                
+                # Times below are relative to the start of the buffer
+                buffered = len(buffer) / SAMPLE_RATE
+                silence_periods = self.detect_silence(buffer)
+                target_end = min(self.chunk_duration, buffered)
                 
-                chunks.append({
-                    'path': chunk_path,
-                    'start': current_start,
-                    'duration': chunk_duration,
-                    'index': chunk_num
-                })
-                chunk_num += 1
+                # Find nearest silence period to target_end
+                best_split = target_end
+                if eof and buffered <= self.chunk_duration:
+                    best_split = buffered
+                else:
+                    min_distance = float('inf')
+                    for silence in silence_periods:
+                        if 0 < silence['end'] <= target_end + SPLIT_LOOKAHEAD:
+                            distance = abs(silence['end'] - target_end)
+                            if distance < min_distance:
+                                min_distance = distance
+                                best_split = silence['end']
+                
+                # Shave leading and trailing silence so the model never has to skip it
+                # (replaces Whisper's VAD)
+                chunk_start, chunk_end = 0, best_split
+                for silence in silence_periods:
+                    if silence['start'] <= chunk_start < silence['end']:
+                        chunk_start = silence['end']
+                    if silence['start'] < chunk_end <= silence['end']:
+                        chunk_end = silence['start']
+                
+                # Skip very short pieces and chunks that are entirely silence
+                if best_split > 0.5 and chunk_end > chunk_start:
+                    start_sample = int(round(chunk_start * SAMPLE_RATE))
+                    end_sample = int(round(chunk_end * SAMPLE_RATE))
+                    yield {
+                        'samples': buffer[start_sample:end_sample],
+                        'start': (buffer_start + start_sample) / SAMPLE_RATE,
+                        'duration': chunk_end - chunk_start,
+                        'index': chunk_num
+                    }
+                    chunk_num += 1
+                
+                # Drop the consumed audio; yielded chunks keep their own views alive
+                split_sample = int(round(best_split * SAMPLE_RATE))
+                buffer = buffer[split_sample:]
+                buffer_start += split_sample
             
-            current_start = best_split
+            if process.wait() != 0:
+                raise subprocess.CalledProcessError(process.returncode, cmd)
+            audio_info['duration'] = buffer_start / SAMPLE_RATE
+        finally:
+            # Stop ffmpeg if the consumer gave up early
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+    
+    def _transcribe_one_chunk(self, chunk_info):
+        """Transcribe a single chunk of the hearing audio with the shared model"""
+        # Select transcription parameters based on mode; fast is greedy decoding
+        if self.transcription_mode == 'fast':
+            beam_size = 1
+            best_of = 1
+        else:  # quality mode
+            beam_size = 5
+            best_of = 5
         
-        logger.info(f"Split audio into {len(chunks)} chunks")
-        return chunks
+        # Previous-text conditioning cannot carry across independently transcribed chunks
+        condition_on_previous_text = False
+        
+        # Convert the chunk's samples to the float32 waveform faster-whisper expects
+        chunk_audio = chunk_info['samples'].astype(np.float32)
+        chunk_audio *= 1.0 / 32768.0
+        
+        # Transcribe
+        segments, info = self.model.transcribe(
+            chunk_audio,
+            language="en",
+            beam_size=beam_size,
+            best_of=best_of,
+            condition_on_previous_text=condition_on_previous_text,
+            vad_filter=False,  # Chunks are already trimmed to the detected speech
+            # A single temperature means a single decoding pass per segment (no fallback
+            # retries). The default log_prob_threshold stays: together with no_speech_threshold
+            # it keeps confidently decoded speech that has a high no-speech probability.
+            temperature=0.0,
+            no_speech_threshold=0.6
+        )
+        
+        # Consume the generator into (start, end, text) tuples, adjusted for the chunk offset;
+        # dicts are only built once, when the chunks are merged
+        offset = chunk_info['start']
+        segment_list = []
+        for segment in segments:
+            text = segment.text.strip()  # faster-whisper prefixes segment text with a space
+            if text:
+                segment_list.append((segment.start + offset, segment.end + offset, text))
+        
+        return {
+            'text': '\n'.join(text for _, _, text in segment_list),
+            'segments': segment_list,
+            'chunk_index': chunk_info['index']
+        }
     
     def merge_chunks(self, chunk_results):
-        """Merge chunk transcriptions maintaining proper timestamps"""
-        # Sort by chunk index
-        chunk_results.sort(key=lambda x: x['chunk_index'])
-        
+        """Merge chunk transcriptions (ordered by chunk index) maintaining proper timestamps"""
         # Merge text with proper line breaks
         full_text = '\n\n'.join(chunk['text'] for chunk in chunk_results if chunk['text'])
         
-        # Merge segments
-        all_segments = []
-        for chunk in chunk_results:
-            all_segments.extend(chunk.get('segments', []))
-        
-        # Sort segments by start time
-        all_segments.sort(key=lambda x: x['start'])
+        # Each chunk's (start, end, text) tuples are already in time order, so a k-way
+        # merge keeps them sorted
+        all_segments = [
+            {'start': start, 'end': end, 'text': text}
+            for start, end, text in heapq.merge(*(chunk['segments'] for chunk in chunk_results))
+        ]
         
         return {
             'text': full_text.strip(),
@@ -425,6 +664,8 @@ class ParallelProcessor:
             try:
                 hearing = await self.download_queue.get()
                 if hearing is None:  # Shutdown signal
+                    # Sentinels count as queue items too; a reused processor's join() needs them done
+                    self.download_queue.task_done()
                     break
                 
                 # Download video
@@ -445,6 +686,7 @@ class ParallelProcessor:
             try:
                 hearing = await self.transcription_queue.get()
                 if hearing is None:  # Shutdown signal
+                    self.transcription_queue.task_done()
                     break
                 
                 # Run transcription in thread pool (CPU-bound)
@@ -464,13 +706,38 @@ class ParallelProcessor:
             except Exception as e:
                 logger.error(f"Transcription worker error: {str(e)}")
     
+    def reset_performance_stats(self):
+        """Start a fresh set of performance counters (per run / per Lambda invocation)"""
+        self.performance_stats = {
+            'downloads': {'successful': 0, 'failed': 0, 'total_bytes': 0, 'total_time': 0},
+            'transcriptions': {'successful': 0, 'failed': 0, 'total_audio_duration': 0, 'total_time': 0}
+        }
+    
+    def delete_later(self, path):
+        """Queue a file for deletion by the background reaper"""
+        self._reaper_queue.put(path)
+    
+    def _reap_files(self):
+        """Reaper thread: delete queued files until the None sentinel arrives"""
+        while True:
+            path = self._reaper_queue.get()
+            if path is None:
+                break
+            try:
+                path.unlink()
+                logger.info(f"Deleted video: {path.name}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"Failed to delete {path}: {str(e)}")
+    
     def cleanup_orphaned_files(self):
         """Clean up orphaned video and chunk files from previous runs"""
         logger.info("Checking for orphaned files...")
         
         # Get list of completed hearing IDs
         completed_ids = set()
-        with psycopg2.connect(self.db_url) as conn:
+        with self._db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT id FROM hearings 
@@ -478,21 +745,28 @@ class ParallelProcessor:
                 """)
                 completed_ids = {row[0] for row in cur.fetchall()}
         
-        # Clean up videos for completed hearings
+        # Clean up videos for completed hearings (format: {hearing_id}.mp4)
         cleaned_videos = 0
-        for video_file in self.videos_dir.glob("*.mp4"):
-            # Extract hearing ID from filename (format: {hearing_id}.mp4)
-            hearing_id = video_file.stem
-            if hearing_id in completed_ids:
-                video_file.unlink()
-                cleaned_videos += 1
-                logger.info(f"Cleaned up completed video: {video_file.name}")
+        with os.scandir(self.videos_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.mp4') and entry.name[:-4] in completed_ids:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        continue
+                    cleaned_videos += 1
+                    logger.info(f"Cleaned up completed video: {entry.name}")
         
         # Clean up all chunks (they should be temporary)
         cleaned_chunks = 0
-        for chunk_file in self.temp_dir.glob("*_chunk_*.wav"):
-            chunk_file.unlink()
-            cleaned_chunks += 1
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
+                if '_chunk_' in entry.name and entry.name.endswith('.wav'):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        continue
+                    cleaned_chunks += 1
         
         if cleaned_videos > 0 or cleaned_chunks > 0:
             logger.info(f"Cleanup complete: removed {cleaned_videos} videos and {cleaned_chunks} chunks")
@@ -505,7 +779,7 @@ class ParallelProcessor:
         self.cleanup_orphaned_files()
         
         # Get pending hearings
-        with psycopg2.connect(self.db_url) as conn:
+        with self._db_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 # Get videos that need downloading
                 cur.execute("""
@@ -534,6 +808,30 @@ class ParallelProcessor:
         logger.info(f"Found {len(hearings_to_download)} videos to download")
         logger.info(f"Found {len(hearings_to_transcribe)} videos to transcribe")
         
+        # One pooled HTTP session for every download in this run
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ssl=self._ssl_context,
+                limit=self.max_downloads * 2,
+                ttl_dns_cache=300
+            ),
+            # Let the response stream buffer a whole download block (the 64 KiB default
+            # pauses the socket long before one is ready)
+            read_bufsize=DOWNLOAD_CHUNK_SIZE
+        )
+        try:
+            await self._run_workers(hearings_to_download, hearings_to_transcribe)
+        finally:
+            await self.http_session.close()
+            self.http_session = None
+        
+        # Print performance summary
+        self.print_performance_summary()
+        
+        logger.info("All processing complete!")
+    
+    async def _run_workers(self, hearings_to_download, hearings_to_transcribe):
+        """Run download and transcription workers until both queues are drained"""
         # Create workers
         download_workers = [
             asyncio.create_task(self.download_worker())
@@ -548,33 +846,50 @@ class ParallelProcessor:
         # Start queue status monitor
         status_monitor = asyncio.create_task(self.print_queue_status())
         
-        # Add items to queues
-        for hearing in hearings_to_download:
-            await self.download_queue.put(hearing)
-        
-        for hearing in hearings_to_transcribe:
-            await self.transcription_queue.put(hearing)
-        
-        # Wait for all tasks to complete
-        await self.download_queue.join()
-        await self.transcription_queue.join()
+        # Flushers are stopped through an event rather than cancelled, so a flush already
+        # running on an executor thread finishes before the final flush and close()
+        stop_flushing = asyncio.Event()
+        status_flusher = asyncio.create_task(self.status_flusher(stop_flushing))
+        completion_flusher = asyncio.create_task(self.completion_flusher(stop_flushing))
         
-        # Shutdown workers
-        for _ in download_workers:
-            await self.download_queue.put(None)
-        for _ in transcription_workers:
-            await self.transcription_queue.put(None)
-        
-        # Wait for workers to finish
-        await asyncio.gather(*download_workers, *transcription_workers)
-        
-        # Cancel status monitor
-        status_monitor.cancel()
-        
-        # Print performance summary
-        self.print_performance_summary()
+        try:
+            # Add items to queues
+            for hearing in hearings_to_download:
+                await self.download_queue.put(hearing)
+            
+            for hearing in hearings_to_transcribe:
+                await self.transcription_queue.put(hearing)
+            
+            # Wait for all tasks to complete
+            await self.download_queue.join()
+            await self.transcription_queue.join()
+            
+            # Shutdown workers
+            for _ in download_workers:
+                await self.download_queue.put(None)
+            for _ in transcription_workers:
+                await self.transcription_queue.put(None)
+            
+            # Wait for workers to finish
+            await asyncio.gather(*download_workers, *transcription_workers)
+        finally:
+            # Nothing from this run may stay pending on the loop: a warm Lambda reuses it, and
+            # leftover tasks would resume during the next invocation
+            background = [*download_workers, *transcription_workers, status_monitor]
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            stop_flushing.set()
+            await asyncio.gather(status_flusher, completion_flusher)
         
-        logger.info("All processing complete!")
+        # Write whatever is still buffered
+        await self.flush_status_updates()
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, self.flush_completions)
+        except Exception as e:
+            logger.error(f"Final completion flush failed: {str(e)}")
+            await loop.run_in_executor(None, self._fail_unsaved_completions)
     
     def get_progress_summary(self):
         """Get current progress summary"""
@@ -618,6 +933,19 @@ class ParallelProcessor:
             shutil.rmtree(tmp_folder)
             logger.info("Removed tmp folder completely")
     
+    def close(self):
+        """Shut down the chunk pool, drain the reaper and release the model and pooled database connections
+        (safe to call twice)"""
+        # Drop the atexit reference too, or a replaced processor (warm Lambda) keeps its model alive
+        atexit.unregister(self.close)
+        self.chunk_executor.shutdown(wait=True)
+        self.model = None
+        if self._reaper.is_alive():
+            self._reaper_queue.put(None)
+            self._reaper.join()
+        if not self.db_pool.closed:
+            self.db_pool.closeall()
+    
     def print_performance_summary(self):
         """Print performance summary statistics"""
         download_stats = self.performance_stats['downloads']
@@ -662,175 +990,253 @@ class ParallelProcessor:
             video_path = Path(video_file_path)
         else:
             video_path = self.videos_dir / f"{hearing_id}.mp4"
-        audio_path = self.temp_dir / f"{hearing_id}_full.wav"
         
         if not video_path.exists():
             logger.error(f"Video not found: {video_path}")
             self._update_status_sync(hearing_id, 'transcription_status', 'failed', f"Video not found: {video_path}")
             return
         
-        # Verify video integrity
-        verify_cmd = ['ffprobe', '-v', 'error', '-show_format', '-show_streams', str(video_path)]
+        # Verify video integrity (the probe also reports the duration)
+        verify_cmd = ['ffprobe', '-v', 'error', '-of', 'json', '-show_format', '-show_streams', str(video_path)]
         try:
             result = subprocess.run(verify_cmd, capture_output=True, text=True, timeout=10)
             if result.returncode != 0:
                 logger.error(f"Video corrupted or incomplete: {video_path}")
                 self._update_status_sync(hearing_id, 'transcription_status', 'failed', f"Video corrupted: {result.stderr}")
                 # Delete corrupted video
-                if self.delete_after and video_path.exists():
-                    video_path.unlink()
-                    logger.info(f"Deleted corrupted video: {video_filename}")
+                if self.delete_after:
+                    self.delete_later(video_path)
                 return
         except subprocess.TimeoutExpired:
             logger.error(f"Video verification timeout: {video_path}")
             self._update_status_sync(hearing_id, 'transcription_status', 'failed', "Video verification timeout")
             return
         
+        # Expected duration from the verification probe (only sizes the progress bar)
+        try:
+            expected_duration = float(json.loads(result.stdout)['format']['duration'])
+        except (ValueError, KeyError):
+            expected_duration = None
+        
         try:
             # Update status
             self._update_status_sync(hearing_id, 'transcription_status', 'processing')
             
             logger.info(f"Starting chunked transcription: {title}")
-            start_time = time.time()
+            start_time = time.monotonic()
             
-            # Extract audio from video
-            logger.info(f"Extracting audio from video: {title}")
-            self.extract_audio(video_path, audio_path)
-            audio_duration = self.get_audio_duration(audio_path)
-            logger.info(f"Audio duration: {audio_duration:.1f}s")
+            # Decode, split and transcribe as a pipeline: chunks are submitted to the shared
+            # chunk pool while ffmpeg is still decoding the rest of the audio
+            logger.info(f"Streaming audio into {self.chunk_workers} chunk workers: {title}")
             
-            # Split into chunks
-            chunks = self.split_audio_with_silence_detection(audio_path, hearing_id)
-            logger.info(f"Created {len(chunks)} chunks for parallel processing")
+            # Bound queued chunks so decoding cannot run far ahead of transcription
+            in_flight = threading.BoundedSemaphore(self.chunk_workers * 2)
+            progress_bar = tqdm(
+                total=math.ceil(expected_duration / self.chunk_duration) if expected_duration else None,
+                desc=f"Transcribing {title[:30]}...",
+                unit='chunk'
+            )
             
-            # Transcribe chunks in parallel
-            chunk_workers = min(self.total_cores // 2, len(chunks))  # Use half the cores
-            logger.info(f"Processing chunks with {chunk_workers} workers")
+            # Set by the first failed chunk so decoding stops right away instead of after the
+            # whole hearing has been submitted
+            chunk_failed = threading.Event()
             
-            # Prepare arguments for worker function
-            worker_args = [(chunk, self.whisper_model, self.transcription_mode) for chunk in chunks]
+            def chunk_done(future):
+                in_flight.release()
+                progress_bar.update(1)
+                if not future.cancelled() and future.exception() is not None:
+                    chunk_failed.set()
             
-            # Create pool and ensure proper cleanup
-            pool = Pool(processes=chunk_workers)
+            audio_info = {}
+            futures = []
+            chunks = self.stream_audio_chunks(video_path, audio_info)
             try:
-                chunk_results = list(tqdm(
-                    pool.imap(transcribe_chunk_worker, worker_args),
-                    total=len(chunks),
-                    desc=f"Transcribing {title[:30]}..."
-                ))
+                for chunk in chunks:
+                    in_flight.acquire()
+                    if chunk_failed.is_set():
+                        in_flight.release()
+                        break
+                    future = self.chunk_executor.submit(self._transcribe_one_chunk, chunk)
+                    future.add_done_callback(chunk_done)
+                    futures.append(future)
+                
+                # Collect results as they finish (a failed chunk surfaces as soon as it completes,
+                # not behind slower earlier chunks) and place each at its chunk index
+                chunk_results = [None] * len(futures)
+                for future in as_completed(futures):
+                    result = future.result()
+                    chunk_results[result['chunk_index']] = result
+            except BaseException:
+                # Drop this hearing's queued chunks so the shared pool moves on to other work
+                # instead of transcribing audio whose result will be discarded
+                for future in futures:
+                    future.cancel()
+                raise
             finally:
-                pool.close()
-                pool.join()
-                pool.terminate()  # Ensure all processes are terminated
+                # Stops ffmpeg if decoding was cut short
+                chunks.close()
+                progress_bar.close()
+            
+            num_chunks = len(chunk_results)
+            audio_duration = audio_info['duration']
+            logger.info(f"Transcribed {num_chunks} chunks, audio duration: {audio_duration:.1f}s")
             
             # Merge results
             merged_result = self.merge_chunks(chunk_results)
             
             # Save transcription
-            safe_title = title.replace('/', '_').replace('\\', '_')[:100]
+            safe_title = title.translate(_SANITIZE)[:100]
             
-            # Save text version
             text_path = self.transcriptions_dir / f"{safe_title}.txt"
-            with open(text_path, 'w') as f:
-                f.write(f"# {title}\n"
-                       f"# State: MI\n"
-                       f"# Chamber: {chamber.capitalize()}\n"
-                       f"# Hearing ID: {hearing_id}\n"
-                       f"# Transcribed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                       f"# Duration: {audio_duration:.1f} seconds\n"
-                       f"# Method: Chunked Parallel Processing\n"
-                       f"# Chunks: {len(chunks)}\n\n"
-                       f"{merged_result['text']}")
+            json_path = self.transcriptions_dir / f"{safe_title}.json"
+            segments_path = self.transcriptions_dir / f"{safe_title}.segments.jsonl"
+            
+            # One timestamp for both the .txt header and the JSON
+            transcribed_at = datetime.now()
             
-            # Prepare transcription JSON
+            # Prepare transcription JSON header
             transcription_json = {
                 "hearing_id": hearing_id,
                 "title": title,
                 "state": "MI",
                 "chamber": chamber,
                 "duration": audio_duration,
-                "transcribed_at": datetime.now().isoformat(),
-                "segments": merged_result['segments'],
+                "transcribed_at": transcribed_at.isoformat(),
                 "method": "chunked_parallel",
-                "chunks": len(chunks),
-                "model": self.whisper_model
+                "chunks": num_chunks,
+                "model": self.whisper_model,
+                "text_file": text_path.name,
+                "segments_file": segments_path.name
             }
             
-            # Save JSON version
-            json_path = self.transcriptions_dir / f"{safe_title}.json"
-            with open(json_path, 'w') as f:
-                json.dump({**transcription_json, "full_text": merged_result['text']}, f, indent=2)
-            
-            # Update database and performance stats
-            duration = time.time() - start_time
-            speedup = audio_duration / duration if duration > 0 else 0
+            # Serialize each segment and the header exactly once (compact). The same strings
+            # become the NDJSON file and, spliced together, the database's full JSON document.
+            segment_lines = [json.dumps(segment, separators=(',', ':')) for segment in merged_result['segments']]
+            header_text = json.dumps(transcription_json, separators=(',', ':'))
+            json_text = f'{header_text[:-1]},"segments":[{",".join(segment_lines)}]}}'
             
-            self._update_transcription_complete_sync(
-                hearing_id, 
-                str(text_path.name), 
-                len(merged_result['text']),
-                duration,
-                transcription_json
+            # Save text, JSON header and NDJSON segments. This already runs on an executor
+            # thread, so the writes never block the event loop. The .json is a thin header that
+            # references the .txt (full text) and .segments.jsonl (one segment per line) by name,
+            # so readers can stream the segments instead of loading one large document.
+            _write_outputs(
+                text_path,
+                TRANSCRIPT_HEADER.format(
+                    title=title,
+                    chamber=chamber.capitalize(),
+                    hearing_id=hearing_id,
+                    transcribed=transcribed_at.strftime('%Y-%m-%d %H:%M:%S'),
+                    duration=audio_duration,
+                    chunks=num_chunks
+                ) + merged_result['text'],
+                json_path,
+                header_text,
+                segments_path,
+                segment_lines
             )
             
-            # Update performance metrics
-            self.performance_stats['transcriptions']['successful'] += 1
-            self.performance_stats['transcriptions']['total_audio_duration'] += audio_duration
-            self.performance_stats['transcriptions']['total_time'] += duration
+            # Queue the database update
+            duration = time.monotonic() - start_time
+            speedup = audio_duration / duration if duration > 0 else 0
             
             logger.info(f"Transcription complete: {title} ({duration:.1f}s, {speedup:.1f}x realtime)")
             
-            # Clean up
-            if audio_path.exists():
-                audio_path.unlink()
-                logger.info(f"Deleted audio file: {audio_path}")
-            
-            # Clean up all chunks for this hearing
-            chunk_pattern = self.temp_dir / f"{hearing_id}_chunk_*.wav"
-            for chunk_file in self.temp_dir.glob(f"{hearing_id}_chunk_*.wav"):
-                if chunk_file.exists():
-                    chunk_file.unlink()
-                    logger.info(f"Deleted chunk: {chunk_file.name}")
-            
-            # Delete video if configured
-            if self.delete_after and video_path.exists():
-                video_path.unlink()
-                logger.info(f"Deleted video: {video_path.name}")
+            # Success is counted and the video deleted only once the row is saved (see flush_completions)
+            self.queue_transcription_complete(
+                hearing_id,
+                merged_result['text'],
+                audio_duration,
+                json_text,
+                video_path,
+                duration
+            )
                 
         except Exception as e:
             logger.error(f"Transcription failed for {title}: {str(e)}")
             self._update_status_sync(hearing_id, 'transcription_status', 'failed', str(e))
             self.performance_stats['transcriptions']['failed'] += 1
-            
-            # Clean up on failure
-            if audio_path.exists():
-                audio_path.unlink()
-            
-            # Clean up any chunks created
-            for chunk_file in self.temp_dir.glob(f"{hearing_id}_chunk_*.wav"):
-                if chunk_file.exists():
-                    chunk_file.unlink()
-    
-    def _update_transcription_complete_sync(self, hearing_id, filename, text_length, duration, transcription_json):
-        """Update transcription completion in database"""
-        with psycopg2.connect(self.db_url) as conn:
+    
+    def queue_transcription_complete(self, hearing_id, transcription_text, audio_duration, json_text,
+                                     video_path, processing_time):
+        """Queue a transcription completion (JSON already serialized); it is written with the next batch flush"""
+        with self._completion_lock:
+            self._completion_buf.append(
+                ((str(hearing_id), transcription_text, json_text), audio_duration, video_path, processing_time)
+            )
+            should_flush = len(self._completion_buf) >= COMPLETION_FLUSH_SIZE
+        
+        if should_flush:
+            try:
+                self.flush_completions()
+            except Exception as e:
+                # The batch is back in the buffer; the periodic flusher retries it
+                logger.error(f"Completion flush error: {str(e)}")
+    
+    def flush_completions(self):
+        """Write all queued transcription completions to the database
+        
+        On failure the batch is put back at the front of the buffer and the error re-raised.
+        Only saved rows count as successful and have their videos deleted.
+        """
+        with self._completion_lock:
+            pending, self._completion_buf = self._completion_buf, []
+        
+        if not pending:
+            return
+        
+        try:
+            self._update_transcription_complete_sync([row for row, _, _, _ in pending])
+        except Exception:
+            with self._completion_lock:
+                self._completion_buf[:0] = pending
+            raise
+        
+        for _, audio_duration, video_path, processing_time in pending:
+            self.performance_stats['transcriptions']['successful'] += 1
+            self.performance_stats['transcriptions']['total_audio_duration'] += audio_duration
+            self.performance_stats['transcriptions']['total_time'] += processing_time
+            if self.delete_after:
+                self.delete_later(video_path)
+    
+    def _fail_unsaved_completions(self):
+        """Mark completions that could not be saved as failed so they are not left 'processing'"""
+        with self._completion_lock:
+            pending, self._completion_buf = self._completion_buf, []
+        
+        for (hearing_id, _, _), _, _, _ in pending:
+            try:
+                self._update_status_sync(hearing_id, 'transcription_status', 'failed')
+            except Exception as e:
+                logger.error(f"Could not mark {hearing_id} failed: {str(e)}")
+            self.performance_stats['transcriptions']['failed'] += 1
+    
+    async def completion_flusher(self, stop):
+        """Flush queued transcription completions periodically until stop is set"""
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=STATUS_FLUSH_INTERVAL)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await loop.run_in_executor(None, self.flush_completions)
+            except Exception as e:
+                logger.error(f"Completion flush error: {str(e)}")
+    
+    def _update_transcription_complete_sync(self, completions):
+        """Update transcription completion in database for a batch of hearings in one transaction"""
+        with self._db_connection() as conn:
             with conn.cursor() as cur:
-                # Read transcription text from file
-                text_path = self.transcriptions_dir / filename
-                transcription_text = ""
-                if text_path.exists():
-                    with open(text_path, 'r') as f:
-                        transcription_text = f.read()
-                
-                cur.execute("""
-                    UPDATE hearings 
+                execute_values(cur, """
+                    UPDATE hearings AS h
                     SET transcription_status = 'completed',
-                        transcription_text = %s,
-                        transcription_json = %s,
+                        transcription_text = v.text,
+                        transcription_json = v.json::jsonb,
                         transcription_completed_at = NOW()
-                    WHERE id = %s
-                """, (transcription_text, json.dumps(transcription_json), hearing_id))
-                conn.commit()
+                    FROM (VALUES %s) AS v(id, text, json)
+                    WHERE h.id = v.id::uuid
+                """, completions)
 
 async def main():
     import argparse
@@ -857,20 +1263,27 @@ async def main():
     )
     
     # Run processing
-    start_time = time.time()
+    start_time = time.monotonic()
     try:
         await processor.process_hearings()
     finally:
-        # Always clean up tmp folder
+        # Always release pooled connections and clean up the tmp folder; close() first so
+        # the reaper has finished its queued deletions before the folder is removed
+        processor.close()
         processor.cleanup_tmp_folder()
     
     # Summary
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     logger.info(f"Total processing time: {duration:.1f} seconds")
 
+# Kept across warm Lambda invocations so the model, chunk pool, DB pool and event loop are
+# only built on a cold start
+_PROCESSOR = None
+_LOOP = None
+
 def lambda_handler(event, context):
     """AWS Lambda handler for serverless execution"""
-    import os
+    global _PROCESSOR, _LOOP
     
     # Set up environment
     db_url = os.environ.get('DATABASE_URL')
@@ -884,16 +1297,29 @@ def lambda_handler(event, context):
     max_downloads = event.get('max_downloads', 1)
     max_transcriptions = event.get('max_transcriptions', 1)
     
-    # Create processor
-    processor = ParallelProcessor(
-        db_url=db_url,
-        max_downloads=max_downloads,
-        max_transcriptions=max_transcriptions
-    )
+    # One event loop for the container's lifetime; created first so the processor's asyncio
+    # queues and locks belong to it
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    
+    # Reuse the warm processor unless its configuration changed
+    if (_PROCESSOR is None or _PROCESSOR.db_url != db_url
+            or _PROCESSOR.max_downloads != max_downloads
+            or _PROCESSOR.max_transcriptions != max_transcriptions):
+        if _PROCESSOR is not None:
+            _PROCESSOR.close()
+        _PROCESSOR = ParallelProcessor(
+            db_url=db_url,
+            max_downloads=max_downloads,
+            max_transcriptions=max_transcriptions
+        )
+    processor = _PROCESSOR
+    processor.reset_performance_stats()
     
     # Run processing
     try:
-        asyncio.run(processor.process_hearings())
+        _LOOP.run_until_complete(processor.process_hearings())
         
         # Return performance stats
         return {
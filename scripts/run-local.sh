@@ -65,7 +65,7 @@ if [ "$CLEAN_DATABASE" = true ]; then
     echo "   ✓ Database schema applied"
     
     # Clean transcription files
-    rm -f transcriptions/*.txt transcriptions/*.json 2>/dev/null || true
+    rm -f transcriptions/*.txt transcriptions/*.json transcriptions/*.jsonl transcriptions/*.tmp 2>/dev/null || true
     echo "   ✓ Transcription files removed"
     
     # Clean tmp folder completely